@@ -0,0 +1,140 @@
+import os
+import pygame
+
+# Mixer settings (512 samples at 44.1 kHz is roughly 12 ms of latency)
+FREQUENCY = 44100
+SAMPLE_SIZE = -16
+STEREO = 2
+BUFFER_SIZE = 512
+NUM_CHANNELS = 16
+RESERVED_CHANNELS = 2
+RESERVED_PRIORITY = 4  # Effects at or above this priority may use reserved channels
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Effect name -> (file, max simultaneous voices, priority)
+EFFECTS = {
+    'jump': ('jump.wav', 1, 1),
+    'hit': ('hit.wav', 4, 2),
+    'pickup': ('Rising_putter.ogg', 2, 2),
+    'explosion': ('Collision.ogg', 3, 3),
+    'boss_hit': ('hit.wav', 2, 3),
+    'game_over': ('Falling_putter.ogg', 1, 5),
+}
+MUSIC = 'Apoxode_-_Electric_1.mp3'
+MUSIC_VOLUME = 0.5
+
+
+def pre_init():
+    # Must run before pygame.init() so the mixer opens with the small buffer
+    pygame.mixer.pre_init(FREQUENCY, SAMPLE_SIZE, STEREO, BUFFER_SIZE)
+
+
+# Sound Manager
+class SoundManager:
+    def __init__(self, effects=EFFECTS, music=MUSIC):
+        self.enabled = True
+        self.music_path = os.path.join(ASSET_DIR, music) if music else None
+        self.effects = {}
+        self.channels = []
+        self.owners = []  # Per channel: (effect name, priority, start tick) or None
+
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(FREQUENCY, SAMPLE_SIZE, STEREO, BUFFER_SIZE)
+        except pygame.error:
+            # No audio device: every call becomes a no-op
+            self.enabled = False
+            return
+
+        pygame.mixer.set_num_channels(NUM_CHANNELS)
+        pygame.mixer.set_reserved(RESERVED_CHANNELS)
+        self.channels = [pygame.mixer.Channel(i) for i in range(NUM_CHANNELS)]
+        self.owners = [None] * NUM_CHANNELS
+
+        # Decode short effects once so playing them never touches the disk;
+        # effects using the same file share one Sound
+        decoded = {}
+        for name, (filename, max_voices, priority) in effects.items():
+            if filename not in decoded:
+                decoded[filename] = pygame.mixer.Sound(os.path.join(ASSET_DIR, filename))
+            self.effects[name] = (decoded[filename], max_voices, priority)
+
+    def play(self, name, volume=1.0):
+        if not self.enabled or name not in self.effects:
+            return None
+        sound, max_voices, priority = self.effects[name]
+
+        voices = self._voices(name)
+        if len(voices) >= max_voices:
+            # Voice limit reached: restart the oldest voice of this effect
+            channel = min(voices, key=lambda i: self.owners[i][2])
+        else:
+            channel = self._find_channel(priority)
+        if channel is None:
+            return None
+
+        self.channels[channel].set_volume(volume)
+        self.channels[channel].play(sound)
+        self.owners[channel] = (name, priority, pygame.time.get_ticks())
+        return self.channels[channel]
+
+    def _voices(self, name):
+        voices = []
+        for i, owner in enumerate(self.owners):
+            if owner is None:
+                continue
+            if not self.channels[i].get_busy():
+                self.owners[i] = None
+            elif owner[0] == name:
+                voices.append(i)
+        return voices
+
+    def _allowed_channels(self, priority):
+        if priority >= RESERVED_PRIORITY:
+            return range(NUM_CHANNELS)
+        return range(RESERVED_CHANNELS, NUM_CHANNELS)
+
+    def _find_channel(self, priority):
+        allowed = self._allowed_channels(priority)
+        for i in allowed:
+            if not self.channels[i].get_busy():
+                return i
+
+        # Every channel is busy: steal the oldest voice with the lowest priority
+        victim = None
+        for i in allowed:
+            owner = self.owners[i]
+            if owner is None or owner[1] > priority:
+                continue
+            if victim is None or owner[1:] < self.owners[victim][1:]:
+                victim = i
+        if victim is not None:
+            self.channels[victim].stop()
+        return victim
+
+    def play_music(self, loops=-1, volume=MUSIC_VOLUME):
+        if not self.enabled or self.music_path is None:
+            return
+        # Music is streamed from disk instead of decoded into memory
+        try:
+            pygame.mixer.music.load(self.music_path)
+        except pygame.error:
+            self.music_path = None
+            return
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops)
+
+    def stop_music(self, fade_ms=0):
+        if not self.enabled:
+            return
+        if fade_ms:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def stop_all(self):
+        if not self.enabled:
+            return
+        pygame.mixer.stop()
+        self.owners = [None] * NUM_CHANNELS
@@ -0,0 +1,96 @@
+import os
+import random
+import sys
+import timeit
+
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from collision import collide, get_mask  # noqa: E402
+from game_core import solid_image  # noqa: E402
+
+# Cost per collision pair: rect-only check against the rect prefilter plus
+# cached mask test, for pairs that miss, pairs that overlap on solid boxes and
+# pairs that overlap on artwork with transparent corners.
+PAIRS = 2000
+REPEAT = 5
+
+
+class Box(pygame.sprite.Sprite):
+    def __init__(self, image, center):
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(center=center)
+
+
+def load_art(name, size):
+    # The art has no alpha channel, so its (JPEG-noisy) near-white
+    # background is made transparent
+    source = pygame.transform.scale(pygame.image.load(os.path.join(ROOT, name)), size)
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.blit(source, (0, 0))
+    for x in range(size[0]):
+        for y in range(size[1]):
+            r, g, b, a = image.get_at((x, y))
+            if min(r, g, b) >= 230:
+                image.set_at((x, y), (r, g, b, 0))
+    return image
+
+
+def make_pairs(image_a, image_b, overlap, rng):
+    pairs = []
+    for _ in range(PAIRS):
+        a = Box(image_a, (400, 300))
+        if overlap:
+            # Somewhere inside a's rect so the rect test always passes
+            center = (rng.randint(a.rect.left, a.rect.right), rng.randint(a.rect.top, a.rect.bottom))
+        else:
+            center = (rng.randint(0, 200), rng.randint(0, 150))
+        pairs.append((a, Box(image_b, center)))
+    return pairs
+
+
+def rect_only(pairs):
+    hits = 0
+    for a, b in pairs:
+        if a.rect.colliderect(b.rect):
+            hits += 1
+    return hits
+
+
+def rect_then_mask(pairs):
+    hits = 0
+    for a, b in pairs:
+        if collide(a, b):
+            hits += 1
+    return hits
+
+
+def per_pair_ns(func, pairs):
+    best = min(timeit.repeat(lambda: func(pairs), number=1, repeat=REPEAT))
+    return best / len(pairs) * 1e9
+
+
+def main():
+    rng = random.Random(1)
+    boss = load_art('boss.png', (100, 100))
+    fireball = load_art('fireball.png', (20, 20))
+    scenarios = [
+        ("miss (rect rejects)", make_pairs(solid_image((100, 100), (255, 165, 0)), solid_image((10, 5), (255, 0, 0)), False, rng)),
+        ("solid boxes overlap", make_pairs(solid_image((100, 100), (255, 165, 0)), solid_image((10, 5), (255, 0, 0)), True, rng)),
+        ("artwork overlap", make_pairs(boss, fireball, True, rng)),
+    ]
+    # Masks are cached, so the first build is not part of the per-pair cost
+    for image in (boss, fireball):
+        get_mask(image)
+
+    print(f"{'scenario':<22}{'rect ns':>10}{'rect+mask ns':>14}{'rect hits':>11}{'mask hits':>11}")
+    for name, pairs in scenarios:
+        print(f"{name:<22}{per_pair_ns(rect_only, pairs):>10.0f}{per_pair_ns(rect_then_mask, pairs):>14.0f}"
+              f"{rect_only(pairs):>11}{rect_then_mask(pairs):>11}")
+
+
+if __name__ == "__main__":
+    main()
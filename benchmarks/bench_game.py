@@ -0,0 +1,325 @@
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from array import array
+
+# Headless: SDL dummy drivers must be picked before pygame is initialised
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game_core import SCREEN_WIDTH, SCREEN_HEIGHT, SCROLL_SPEED, World  # noqa: E402
+from parallax import Background  # noqa: E402
+from profiler import FrameProfiler, percentile  # noqa: E402
+
+# Stress scenarios for the game loop. Every scenario drives a World with a
+# scripted player and records per-frame update, collision and render times
+# plus allocation counts. Timings are divided by a fixed calibration
+# workload timed every few frames during the run, so baseline.json holds
+# machine independent ratios rather than milliseconds. Each scenario runs
+# several times; figures are reported as the median over the runs, while
+# the timing gate uses the median frame (p50) of the fastest run, since
+# other load on the machine can only make a run slower. p95 and above are
+# reported but too noisy to fail on. Any p50 ratio or allocation figure
+# that grew past the tolerance fails the run. Scenarios that restart the
+# game time World.reset on its own, outside the frame phases.
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+TOLERANCE = 0.3  # Allowed growth over the baseline
+SLACK_MS = 0.05  # Absolute slack so tiny timings don't fail on noise
+REPEATS = 3  # Runs per scenario
+CALIBRATE_EVERY = 10  # Frames between calibration samples
+SLACK_BLOCKS = 50
+INVULNERABLE = 10 ** 9  # Lives given to the scripted player
+SEED = 1
+
+# (profiler phase, reported name)
+PHASES = (('events', 'script'), ('update', 'update'), ('collision', 'collision'),
+          ('spawn', 'spawn'), ('draw', 'render'))
+
+SCENARIOS = {}
+
+
+def scenario(name, frames, restart_every=None):
+    # restart_every: frames between timed World.reset calls, if any
+    def register(setup):
+        SCENARIOS[name] = (setup, frames, restart_every)
+        return setup
+    return register
+
+
+def load_game_script():
+    # The HUD renderer lives in the game script, whose name is not importable
+    spec = importlib.util.spec_from_file_location('game_script', os.path.join(ROOT, 'import pygame.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def random_y(rng):
+    return rng.randint(100, SCREEN_HEIGHT - 100)
+
+
+def top_up_enemies(world, count, rng, x=None):
+    while len(world.enemies) < count:
+        world.spawn_enemy(rng.randint(0, SCREEN_WIDTH) if x is None else x, random_y(rng))
+
+
+def script_controls(frame):
+    # Walk back and forth, jumping every second
+    return (frame % 240 >= 120, frame % 240 < 120, frame % 60 == 0)
+
+
+@scenario('enemies_1k', 300)
+def enemies_1k(world, rng):
+    top_up_enemies(world, 1000, rng)
+
+    def drive(frame):
+        top_up_enemies(world, 1000, rng, SCREEN_WIDTH)
+        if frame % 10 == 0:
+            world.shoot()
+        return script_controls(frame)
+    return drive
+
+
+@scenario('projectiles_5k', 300)
+def projectiles_5k(world, rng):
+    def drive(frame):
+        top_up_enemies(world, 20, rng, SCREEN_WIDTH)
+        while len(world.projectiles) < 5000:
+            world.spawn_projectile(rng.randint(0, SCREEN_WIDTH - 20), random_y(rng))
+        return script_controls(frame)
+    return drive
+
+
+@scenario('boss_swarm', 600)
+def boss_swarm(world, rng):
+    def drive(frame):
+        if not world.boss.alive():
+            world.spawn_boss(SCREEN_HEIGHT // 2)
+            world.boss.health = INVULNERABLE
+        top_up_enemies(world, 200, rng, SCREEN_WIDTH)
+        if frame % 5 == 0:
+            world.shoot()
+        return script_controls(frame)
+    return drive
+
+
+@scenario('restarts', 12000, restart_every=30)
+def restarts(world, rng):
+    # 400 short games back to back; memory and restart time must stay flat.
+    # The world has just been reset on every 30th frame.
+    def drive(frame):
+        if frame % 30 == 0:
+            top_up_enemies(world, 50, rng)
+        if frame % 10 == 0:
+            world.shoot()
+        return script_controls(frame)
+    return drive
+
+
+# Calibration: a fixed amount of sprite-like work (Python attribute updates
+# and Rect collisions). Everything is built once so timing it allocates nothing.
+class Calibration:
+    def __init__(self):
+        self.rects = [pygame.Rect(i * 7 % SCREEN_WIDTH, i * 13 % SCREEN_HEIGHT, 50, 50) for i in range(500)]
+        self.probe = pygame.Rect(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, 100, 100)
+
+    def sample(self):
+        # Milliseconds one pass of the workload takes right now
+        start = time.perf_counter()
+        for _ in range(10):
+            for rect in self.rects:
+                rect.x -= 2
+                if rect.right < 0:
+                    rect.left = SCREEN_WIDTH
+            self.probe.collidelist(self.rects)
+        return (time.perf_counter() - start) * 1000
+
+
+def summarize(values):
+    ordered = sorted(values)
+    return {
+        'mean': round(sum(ordered) / len(ordered), 4),
+        'p50': round(percentile(ordered, 50), 4),
+        'p95': round(percentile(ordered, 95), 4),
+        'p99': round(percentile(ordered, 99), 4),
+        'max': round(ordered[-1], 4),
+    }
+
+
+def run_scenario(name, screen, font, background, game, calibration):
+    setup, frames, restart_every = SCENARIOS[name]
+    # Free the world of the previous run first, it holds reference cycles
+    gc.collect()
+    rng = random.Random(SEED)
+    profiler = FrameProfiler(enabled=True)
+    world = World(profiler, seed=SEED)
+    world.player.lives = INVULNERABLE
+    drive = setup(world, rng)
+
+    # Samples go into preallocated arrays so recording them allocates nothing
+    times = {label: array('d', [0.0]) * frames for phase, label in PHASES}
+    totals = array('d', [0.0]) * frames
+    blocks = array('q', [0]) * frames
+    samples = array('d', [0.0]) * -(-frames // CALIBRATE_EVERY)
+    restarts = array('d', [0.0]) * (-(-frames // restart_every) if restart_every else 0)
+    collections = sum(stat['collections'] for stat in gc.get_stats())
+    start_blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % CALIBRATE_EVERY == 0:
+            samples[frame // CALIBRATE_EVERY] = calibration.sample()
+        before = sys.getallocatedblocks()
+        if restart_every and frame % restart_every == 0:
+            restart = time.perf_counter()
+            world.reset()
+            restarts[frame // restart_every] = (time.perf_counter() - restart) * 1000
+            world.player.lives = INVULNERABLE
+        profiler.begin_frame()
+        controls = drive(frame)
+        profiler.mark('events')
+        world.step(controls)
+        game.draw_world(screen, font, world, background)
+        profiler.mark('draw')
+        total = 0.0
+        for phase, label in PHASES:
+            times[label][frame] = profiler.current[phase]
+            total += profiler.current[phase]
+        totals[frame] = total
+        blocks[frame] = sys.getallocatedblocks() - before
+    elapsed = time.perf_counter() - start
+
+    result = {'frames': frames, 'seconds': round(elapsed, 3),
+              'calibration_ms': round(statistics.median(samples), 4)}
+    for phase, label in PHASES:
+        result[label] = summarize(times[label])
+    result['frame'] = summarize(totals)
+    if restarts:
+        result['restart'] = summarize(restarts)
+    result['alloc_blocks_per_frame'] = summarize(blocks)
+    result['alloc_blocks_growth'] = sys.getallocatedblocks() - start_blocks
+    result['gc_collections'] = sum(stat['collections'] for stat in gc.get_stats()) - collections
+    return result
+
+
+def timed_keys(result):
+    keys = ('frame',) + tuple(label for phase, label in PHASES)
+    return keys + ('restart',) if 'restart' in result else keys
+
+
+def run_repeated(name, screen, font, background, game, repeats):
+    # Median over several runs; timing ratios are from the fastest run
+    calibration = Calibration()
+    runs = []
+    for _ in range(repeats):
+        result = run_scenario(name, screen, font, background, game, calibration)
+        result['p50_ratio'] = {key: result[key]['p50'] / result['calibration_ms'] for key in timed_keys(result)}
+        runs.append(result)
+
+    median = {'frames': runs[0]['frames'], 'repeats': repeats}
+    for key in ('seconds', 'calibration_ms', 'alloc_blocks_growth', 'gc_collections'):
+        median[key] = statistics.median(run[key] for run in runs)
+    for key in timed_keys(runs[0]) + ('alloc_blocks_per_frame',):
+        median[key] = {stat: statistics.median(run[key][stat] for run in runs) for stat in runs[0][key]}
+    median['p50_ratio'] = {key: round(min(run['p50_ratio'][key] for run in runs), 5)
+                           for key in timed_keys(runs[0])}
+    return median, runs
+
+
+def baseline_entry(result):
+    # Only machine independent figures go into the baseline
+    return {'p50_ratio': result['p50_ratio'], 'alloc_blocks_growth': result['alloc_blocks_growth']}
+
+
+def compare(results, baseline, tolerance):
+    # Returns a list of human readable threshold failures
+    failures = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        slack = SLACK_MS / result['calibration_ms']
+        # A single slow run is indistinguishable from a regression, so
+        # fewer runs than REPEATS only check allocations
+        timed = timed_keys(result) if result['repeats'] >= REPEATS else ()
+        for key in timed:
+            limit = base['p50_ratio'][key] * (1 + tolerance) + slack
+            ratio = result['p50_ratio'][key]
+            if ratio > limit:
+                failures.append(f"{name}: {key} p50 is {ratio:.4f} x calibration > {limit:.4f} "
+                                f"({result[key]['p50']:.3f} ms)")
+        limit = max(base['alloc_blocks_growth'], 0) * (1 + tolerance) + SLACK_BLOCKS
+        if result['alloc_blocks_growth'] > limit:
+            failures.append(f"{name}: allocated blocks grew by {result['alloc_blocks_growth']} > {limit:.0f}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless stress benchmarks for the game loop.")
+    parser.add_argument('scenarios', nargs='*', default=list(SCENARIOS), help="Scenarios to run (default: all)")
+    parser.add_argument('--output', default='bench_output.json', help="Where to write the results")
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE)
+    parser.add_argument('--repeats', type=int, default=REPEATS, help="Runs per scenario")
+    parser.add_argument('--update-baseline', action='store_true', help="Store these results as the new baseline")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 30)
+    background = Background(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_HEIGHT - 50, SCROLL_SPEED)
+    game = load_game_script()
+
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"unknown scenario {name!r}, choose from {', '.join(SCENARIOS)}")
+    if args.repeats < 1:
+        parser.error("--repeats must be at least 1")
+    if args.repeats < REPEATS and not args.update_baseline:
+        print(f"Fewer than {REPEATS} repeats: timings are reported but not gated")
+
+    results = {}
+    output = {}
+    for name in args.scenarios:
+        result, runs = run_repeated(name, screen, font, background, game, args.repeats)
+        results[name] = result
+        output[name] = {'median': result, 'runs': runs}
+        print(f"{name:<15} frame p50 {result['frame']['p50']:7.3f} ms  p95 {result['frame']['p95']:7.3f} ms  "
+              f"update {result['update']['p95']:7.3f}  collision {result['collision']['p95']:7.3f}  "
+              f"render {result['render']['p95']:7.3f}  calibration {result['calibration_ms']:6.3f} ms  "
+              f"blocks +{result['alloc_blocks_growth']:.0f}")
+        if 'restart' in result:
+            print(f"{'':<15} restart p50 {result['restart']['p50']:7.3f} ms  p95 {result['restart']['p95']:7.3f} ms")
+    pygame.quit()
+
+    with open(args.output, 'w') as f:
+        json.dump(output, f, indent=1)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({name: baseline_entry(result) for name, result in results.items()}, f, indent=1)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against; run with --update-baseline first")
+        return 0
+    with open(args.baseline) as f:
+        failures = compare(results, json.load(f), args.tolerance)
+    for failure in failures:
+        print("FAIL", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
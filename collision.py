@@ -0,0 +1,34 @@
+import weakref
+
+import pygame
+
+# Pixel-accurate collisions. Masks are built once per image (each animation
+# frame is its own image) and cached; they are dropped with the image.
+_masks = weakref.WeakKeyDictionary()
+
+
+def get_mask(image):
+    mask = _masks.get(image)
+    if mask is None:
+        # Honours per-pixel alpha and colorkeys, so transparent corners of
+        # artwork never count as hits
+        mask = pygame.mask.from_surface(image)
+        _masks[image] = mask
+    return mask
+
+
+def sprite_mask(sprite):
+    # Sprites keep the mask of their current image, so the shared cache is
+    # only looked up again when the image (animation frame) changes
+    if getattr(sprite, 'mask_image', None) is not sprite.image:
+        sprite.mask = get_mask(sprite.image)
+        sprite.mask_image = sprite.image
+    return sprite.mask
+
+
+def collide(a, b):
+    # Cheap rect overlap first; only overlapping pairs pay for the mask test
+    if not a.rect.colliderect(b.rect):
+        return False
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    return sprite_mask(a).overlap(sprite_mask(b), offset) is not None
@@ -0,0 +1,210 @@
+import argparse
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import levels
+from game_core import SCREEN_WIDTH, SCREEN_HEIGHT, JUMP_STRENGTH, BOSS_HEALTH, ENEMY_SPEED, World
+
+# Batched, display-free game environment for bots and balance runs.
+# VecEnv steps N independent worlds per call and returns one observation
+# row per world; run_games spreads batches over a process pool.
+
+# Actions are bit flags, combined per world: LEFT | SHOOT etc.
+LEFT = 1
+RIGHT = 2
+JUMP = 4
+SHOOT = 8
+SHOOT_COOLDOWN = 10  # Frames between shots, roughly how fast a player can tap Q
+
+MAX_FRAMES = 3600  # A game is cut off after one minute of game time
+NEAREST = 4  # Enemies and collectibles listed in each observation
+
+# Observation row: player x, y, velocity, health, lives, boss fight flag,
+# boss health, then (dx, dy, present) for the NEAREST closest enemies and
+# the NEAREST closest collectibles, relative to the player
+PLAYER_FEATURES = 7
+OBS_SIZE = PLAYER_FEATURES + 2 * 3 * NEAREST
+
+
+def observe(world, row):
+    player = world.player.rect
+    row[:] = 0.0
+    row[0] = player.centerx / SCREEN_WIDTH
+    row[1] = player.centery / SCREEN_HEIGHT
+    row[2] = world.player.velocity / JUMP_STRENGTH
+    row[3] = world.player.health / 100
+    row[4] = world.player.lives / 3
+    if world.boss_fight:
+        row[5] = 1.0
+        row[6] = world.boss.health / world.boss_health
+
+    offset = PLAYER_FEATURES
+    for group in (world.enemies, world.collectibles):
+        nearest = heapq.nsmallest(NEAREST, group, key=lambda s: abs(s.rect.centerx - player.centerx))
+        for i, sprite in enumerate(nearest):
+            j = offset + 3 * i
+            row[j] = (sprite.rect.centerx - player.centerx) / SCREEN_WIDTH
+            row[j + 1] = (sprite.rect.centery - player.centery) / SCREEN_HEIGHT
+            row[j + 2] = 1.0
+        offset += 3 * NEAREST
+
+
+def heuristic_policy(obs):
+    # Simple scripted player: keep shooting, jump over close enemies on the
+    # same height and walk towards the nearest collectible when hurt
+    actions = np.full(len(obs), SHOOT, dtype=np.int32)
+    enemy_dx = obs[:, PLAYER_FEATURES]
+    enemy_dy = obs[:, PLAYER_FEATURES + 1]
+    enemy_present = obs[:, PLAYER_FEATURES + 2] > 0
+    close = enemy_present & (enemy_dx > 0) & (enemy_dx < 0.12) & (np.abs(enemy_dy) < 0.1)
+    actions[close] |= JUMP
+
+    item = PLAYER_FEATURES + 3 * NEAREST
+    hurt = (obs[:, 3] < 0.5) & (obs[:, item + 2] > 0)
+    actions[hurt & (obs[:, item] < 0)] |= LEFT
+    actions[hurt & (obs[:, item] > 0)] |= RIGHT
+    return actions
+
+
+# Vectorized Environment: N independent games stepped together
+# Every game gets its own seed, counting up from seed, so no two games in
+# one VecEnv play the same level layout. With num_games set, no new games
+# are started after that many; worlds whose game ends then sit idle until
+# the rest finish, so short games don't crowd out long ones in results.
+class VecEnv:
+    def __init__(self, num_envs, max_frames=MAX_FRAMES, seed=0, num_games=None, **settings):
+        # Levels are parsed once per process and shared by every world
+        self.worlds = [World(level_source=levels.parsed_level, **settings) for _ in range(num_envs)]
+        self.max_frames = max_frames
+        self.first_seed = seed
+        self.next_seed = seed
+        self.num_games = num_games
+        self.active = np.zeros(num_envs, dtype=bool)
+        self.obs = np.zeros((num_envs, OBS_SIZE), dtype=np.float32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.dones = np.zeros(num_envs, dtype=bool)
+        self.cooldowns = np.zeros(num_envs, dtype=np.int32)
+        # (seed, score, level, frames) of every game that ended, in finishing order
+        self.results = []
+
+    @property
+    def games_started(self):
+        return self.next_seed - self.first_seed
+
+    @property
+    def finished(self):
+        # Every allowed game has been started and has ended
+        return not self.active.any()
+
+    def _new_game(self, i):
+        if self.num_games is not None and self.games_started >= self.num_games:
+            self.active[i] = False
+            return
+        self.worlds[i].reset(self.next_seed)
+        self.next_seed += 1
+        self.active[i] = True
+
+    def reset(self):
+        for i, world in enumerate(self.worlds):
+            self._new_game(i)
+            observe(world, self.obs[i])
+        self.cooldowns[:] = 0
+        return self.obs.copy()
+
+    def step(self, actions):
+        # Finished games are recorded and reset straight away, so every row
+        # belongs to a running game until num_games have been started.
+        # Idle rows keep their last observation and get no reward.
+        self.rewards[:] = 0.0
+        self.dones[:] = False
+        for i, world in enumerate(self.worlds):
+            if not self.active[i]:
+                continue
+            action = int(actions[i])
+            if action & SHOOT and self.cooldowns[i] == 0:
+                world.shoot()
+                self.cooldowns[i] = SHOOT_COOLDOWN
+            elif self.cooldowns[i]:
+                self.cooldowns[i] -= 1
+
+            player = world.player
+            before = world.score + player.lives * 100 + player.health
+            world.step((bool(action & LEFT), bool(action & RIGHT), bool(action & JUMP)))
+            self.rewards[i] = world.score + player.lives * 100 + player.health - before
+
+            done = world.game_over or world.frames >= self.max_frames
+            self.dones[i] = done
+            if done:
+                self.results.append((world.seed, world.score, world.level, world.frames))
+                self._new_game(i)
+                self.cooldowns[i] = 0
+            observe(world, self.obs[i])
+        return self.obs.copy(), self.rewards.copy(), self.dones.copy()
+
+
+def _run_batch(job):
+    num_games, batch_size, max_frames, policy, seed, settings = job
+    env = VecEnv(min(batch_size, num_games), max_frames, seed, num_games, **settings)
+    obs = env.reset()
+    # Every started game is played to its end, however long it lasts
+    while not env.finished:
+        obs = env.step(policy(obs))[0]
+    return env.results
+
+
+def run_games(num_games, workers=None, batch_size=64, max_frames=MAX_FRAMES,
+              policy=heuristic_policy, seed=0, **settings):
+    # Play num_games games across a process pool; returns an array with one
+    # (seed, score, level, frames) row per game. policy must be a module level
+    # function so it can be sent to the worker processes.
+    workers = workers or os.cpu_count() or 1
+    per_worker = -(-num_games // workers)
+    jobs = []
+    remaining = num_games
+    while remaining > 0:
+        count = min(per_worker, remaining)
+        jobs.append((count, batch_size, max_frames, policy, seed, settings))
+        remaining -= count
+        seed += count  # A batch plays exactly count games, one seed each
+    if len(jobs) == 1:
+        results = _run_batch(jobs[0])
+    else:
+        results = []
+        with ProcessPoolExecutor(len(jobs)) as pool:
+            for batch in pool.map(_run_batch, jobs):
+                results.extend(batch)
+    return np.array(results, dtype=np.int64).reshape(-1, 4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run simulated games for difficulty balancing.")
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-frames', type=int, default=MAX_FRAMES)
+    parser.add_argument('--enemy-speed', type=int, nargs='+', default=[ENEMY_SPEED])
+    parser.add_argument('--boss-health', type=int, nargs='+', default=[BOSS_HEALTH])
+    parser.add_argument('--spawn-rate', type=float, nargs='+', default=[1.0])
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game")
+    args = parser.parse_args()
+
+    print("enemy_speed boss_health spawn_rate  mean_score  mean_level  survived  games/min")
+    for enemy_speed in args.enemy_speed:
+        for boss_health in args.boss_health:
+            for spawn_rate in args.spawn_rate:
+                start = time.perf_counter()
+                results = run_games(args.games, args.workers, max_frames=args.max_frames,
+                                    enemy_speed=enemy_speed, boss_health=boss_health,
+                                    spawn_rate=spawn_rate, seed=args.seed)
+                elapsed = time.perf_counter() - start
+                survived = np.mean(results[:, 3] >= args.max_frames)
+                print(f"{enemy_speed:11d} {boss_health:11d} {spawn_rate:10.2f} "
+                      f"{results[:, 1].mean():11.1f} {results[:, 2].mean():11.2f} "
+                      f"{survived:9.0%} {args.games / elapsed * 60:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+import random
+
+import pygame
+
+import levels
+from collision import collide
+from profiler import FrameProfiler
+
+# Display-free game simulation. Nothing here opens a window, reads the
+# keyboard or plays sounds, so many worlds can run in one process.
+
+# Constants
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+FPS = 60
+GRAVITY = 0.8
+PLAYER_SPEED = 5
+JUMP_STRENGTH = 12
+PROJECTILE_SPEED = 10
+ENEMY_SPEED = 2
+COLLECTIBLE_SIZE = 20
+COLLECTIBLE_SPEED = 2
+BOSS_HEALTH = 200
+CONTACT_DAMAGE = 20
+HEALTH_PICKUP = 20
+LANE_JITTER = 20  # Spawns land up to this many pixels off their lane
+# World.update moves every sprite twice a frame (once through all_sprites,
+# once through its own group), so pickups resting on the scrolling ground
+# really drift twice their speed per frame. Scenery scrolls at that rate.
+SCROLL_SPEED = 2 * COLLECTIBLE_SPEED
+
+# Colors
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+ORANGE = (255, 165, 0)
+
+# Player controls: (left, right, jump)
+NO_CONTROLS = (False, False, False)
+
+# Image cache: sprites of the same size and colour share one Surface
+_images = {}
+
+
+def solid_image(size, color):
+    key = (size, color)
+    if key not in _images:
+        image = pygame.Surface(size)
+        image.fill(color)
+        _images[key] = image
+    return _images[key]
+
+
+# Sprite Pool: killed sprites are kept and reused for the next spawn
+class SpritePool:
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+
+    def get(self, *args):
+        if self.free:
+            sprite = self.free.pop()
+            sprite.reset(*args)
+        else:
+            sprite = self.cls(*args)
+            sprite.pool = self
+        return sprite
+
+
+class PooledSprite(pygame.sprite.Sprite):
+    pool = None
+
+    def kill(self):
+        if self.alive() and self.pool is not None:
+            self.pool.free.append(self)
+        super().kill()
+
+
+# Player Class (Hero)
+class Player(pygame.sprite.Sprite):
+    def __init__(self):
+        super().__init__()
+        self.image = solid_image((50, 50), BLUE)
+        self.rect = self.image.get_rect()
+        self.speed = PLAYER_SPEED
+        self.controls = NO_CONTROLS
+        self.reset()
+
+    def reset(self):
+        self.rect.center = (100, SCREEN_HEIGHT - 100)
+        self.velocity = 0
+        self.health = 100
+        self.lives = 3
+        self.is_jumping = False
+        self.jump_count = 10
+
+    def update(self):
+        left, right, jump = self.controls
+
+        # Horizontal movement
+        if left:
+            self.rect.x -= self.speed
+        if right:
+            self.rect.x += self.speed
+
+        # Jumping
+        if not self.is_jumping:
+            if jump:
+                self.velocity = -JUMP_STRENGTH
+                self.is_jumping = True
+        else:
+            self.velocity += GRAVITY
+            self.rect.y += self.velocity
+
+        # Prevent player from going out of screen
+        if self.rect.left < 0:
+            self.rect.left = 0
+        if self.rect.right > SCREEN_WIDTH:
+            self.rect.right = SCREEN_WIDTH
+        if self.rect.bottom > SCREEN_HEIGHT - 50:
+            self.rect.bottom = SCREEN_HEIGHT - 50
+            self.is_jumping = False
+            self.velocity = 0
+
+    def take_damage(self, damage):
+        self.health -= damage
+        if self.health <= 0:
+            self.lives -= 1
+            self.health = 100 if self.lives > 0 else 0
+
+    def heal(self, amount):
+        self.health = min(100, self.health + amount)
+
+# Projectile Class
+class Projectile(PooledSprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = solid_image((10, 5), RED)
+        self.rect = self.image.get_rect()
+        self.speed = PROJECTILE_SPEED
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.center = (x, y)
+
+    def update(self):
+        self.rect.x += self.speed
+        if self.rect.right > SCREEN_WIDTH:
+            self.kill()
+
+# Enemy Class
+class Enemy(PooledSprite):
+    def __init__(self, x, y):
+        super().__init__()
+        self.image = solid_image((50, 50), RED)
+        self.rect = self.image.get_rect()
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        self.rect.center = (x, y)
+        self.health = 50
+        self.speed = ENEMY_SPEED
+
+    def update(self):
+        self.rect.x -= self.speed
+        if self.rect.right < 0:
+            self.kill()
+
+    def take_damage(self, damage):
+        self.health -= damage
+        if self.health <= 0:
+            self.kill()
+
+# Collectible Class
+class Collectible(PooledSprite):
+    def __init__(self, x, y, type):
+        super().__init__()
+        self.reset(x, y, type)
+
+    def reset(self, x, y, type):
+        self.type = type
+        if self.type == 'health':
+            self.image = solid_image((COLLECTIBLE_SIZE, COLLECTIBLE_SIZE), GREEN)
+        else:
+            self.image = solid_image((COLLECTIBLE_SIZE, COLLECTIBLE_SIZE), WHITE)
+        self.rect = self.image.get_rect()
+        self.rect.center = (x, y)
+
+    def update(self):
+        self.rect.x -= COLLECTIBLE_SPEED
+        if self.rect.right < 0:
+            self.kill()
+
+# Level class with Boss Enemy
+class Boss(Enemy):
+    def __init__(self, x, y):
+        super().__init__(x, y)
+        self.image = solid_image((100, 100), ORANGE)  # Orange boss color
+        self.rect = self.image.get_rect()
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        super().reset(x, y)
+        self.health = BOSS_HEALTH
+        self.speed = 1
+
+# Game World: sprites, pools, score and level progress for one game.
+# It is built once and reset on restart, so restarts allocate nothing new.
+# Things the front end reacts to (sounds, effects) are reported in
+# self.events as (name, x, y) tuples, refreshed every step.
+# seed picks the world's random lane jitter; the same seed and controls
+# always play out the same game.
+class World:
+    def __init__(self, profiler=None, level_source=levels.level_path,
+                 enemy_speed=ENEMY_SPEED, boss_health=BOSS_HEALTH, spawn_rate=1.0, seed=None):
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.rng = random.Random(seed)
+        self.seed = seed
+        self.level_source = level_source
+        # Balance settings; spawn_rate scales how fast the level timeline runs
+        self.enemy_speed = enemy_speed
+        self.boss_health = boss_health
+        self.spawn_rate = spawn_rate
+
+        self.player = Player()
+        self.boss = Boss(SCREEN_WIDTH, SCREEN_HEIGHT // 2)
+        self.all_sprites = pygame.sprite.Group()
+        self.projectiles = pygame.sprite.Group()
+        self.enemies = pygame.sprite.Group()
+        self.collectibles = pygame.sprite.Group()
+        self.projectile_pool = SpritePool(Projectile)
+        self.enemy_pool = SpritePool(Enemy)
+        self.collectible_pool = SpritePool(Collectible)
+        self.timeline = levels.SpawnTimeline(level_source(1))
+        self.events = []
+        self.reset()
+
+    def reset(self, seed=None):
+        # Killing pooled sprites hands them back to their pools.
+        # A new seed starts a different game; without one the RNG runs on
+        if seed is not None:
+            self.rng.seed(seed)
+            self.seed = seed
+        for sprite in self.all_sprites.sprites():
+            sprite.kill()
+        self.player.reset()
+        self.all_sprites.add(self.player)
+        self.score = 0
+        self.frames = 0
+        self.boss_fight = False
+        self.game_over = False
+        del self.events[:]
+        self.start_level(1)
+
+    def start_level(self, level):
+        self.level = level
+        self.frame = 0.0  # Level clock, advanced by spawn_rate every step
+        self.timeline.load(self.level_source(level))
+
+    def shoot(self):
+        self.spawn_projectile(self.player.rect.centerx, self.player.rect.top)
+
+    def spawn_projectile(self, x, y):
+        projectile = self.projectile_pool.get(x, y)
+        self.all_sprites.add(projectile)
+        self.projectiles.add(projectile)
+        return projectile
+
+    def spawn_enemy(self, x, y):
+        enemy = self.enemy_pool.get(x, y)
+        enemy.speed = self.enemy_speed
+        self.all_sprites.add(enemy)
+        self.enemies.add(enemy)
+        return enemy
+
+    def spawn_collectible(self, x, y, type):
+        collectible = self.collectible_pool.get(x, y, type)
+        self.all_sprites.add(collectible)
+        self.collectibles.add(collectible)
+        return collectible
+
+    def spawn_boss(self, y):
+        self.boss.reset(SCREEN_WIDTH, y)
+        self.boss.health = self.boss_health
+        self.all_sprites.add(self.boss)
+        self.enemies.add(self.boss)
+        self.boss_fight = True
+        return self.boss
+
+    def update(self, controls=NO_CONTROLS):
+        player = self.player
+        events = self.events
+
+        # Update all sprites
+        was_jumping = player.is_jumping
+        player.controls = controls
+        self.all_sprites.update()
+        self.projectiles.update()
+        self.enemies.update()
+        self.collectibles.update()
+        if player.is_jumping and not was_jumping:
+            events.append(('jump', player.rect.centerx, player.rect.bottom))
+        self.profiler.mark('update')
+
+        # Collision detection
+        for projectile in self.projectiles:
+            for enemy in self.enemies:
+                if collide(projectile, enemy):
+                    enemy.take_damage(25)
+                    self.score += 10
+                    projectile.kill()
+                    if not enemy.alive():
+                        name = 'explosion'
+                    elif enemy is self.boss:
+                        name = 'boss_hit'
+                    else:
+                        name = 'hit'
+                    events.append((name, enemy.rect.centerx, enemy.rect.centery))
+
+        for enemy in pygame.sprite.spritecollide(player, self.enemies, False, collide):
+            player.take_damage(CONTACT_DAMAGE)
+            if enemy is not self.boss:
+                enemy.kill()
+            events.append(('hit', player.rect.centerx, player.rect.centery))
+
+        for collectible in pygame.sprite.spritecollide(player, self.collectibles, True, collide):
+            if collectible.type == 'health':
+                player.heal(HEALTH_PICKUP)
+            events.append(('pickup', collectible.rect.centerx, collectible.rect.centery))
+        self.profiler.mark('collision')
+
+    def step(self, controls=NO_CONTROLS):
+        # One frame of play: sprites, collisions, then the level timeline
+        del self.events[:]
+        if self.game_over:
+            return
+        self.update(controls)
+        self.frames += 1
+        if self.player.lives <= 0:
+            self.game_over = True
+            return
+
+        # The level timeline is paused until the boss is beaten or escapes
+        if self.boss_fight:
+            self.boss_fight = self.boss.alive()
+            return
+
+        # Spawn enemies and collectibles due on the level timeline
+        for frame, type, y in self.timeline.advance(int(self.frame)):
+            if type == 'boss':
+                self.spawn_boss(y)
+                continue
+            # Keep jittered spawns between the top of the screen and the ground
+            y = min(max(y + self.rng.randint(-LANE_JITTER, LANE_JITTER), 25), SCREEN_HEIGHT - 75)
+            if type == 'enemy':
+                self.spawn_enemy(SCREEN_WIDTH, y)
+            else:
+                self.spawn_collectible(SCREEN_WIDTH, y, type)
+        self.frame += self.spawn_rate
+        self.profiler.mark('spawn')
+
+        # Level is complete once its timeline is done and the screen is clear
+        if self.timeline.finished and not self.enemies:
+            self.start_level(self.level + 1)
@@ -1,225 +1,178 @@
+import os
+
 import pygame
-import random
-import sys
-
-# Initialize Pygame
-pygame.init()
-
-# Constants
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
-GRAVITY = 0.8
-PLAYER_SPEED = 5
-JUMP_STRENGTH = 12
-PROJECTILE_SPEED = 10
-ENEMY_SPEED = 2
-COLLECTIBLE_SIZE = 20
-BOSS_HEALTH = 200
-
-# Colors
-WHITE = (255, 255, 255)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-
-# Initialize the screen
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Animal Hero Adventure")
-clock = pygame.time.Clock()
-
-# Font for score and health
-font = pygame.font.SysFont("Arial", 30)
-
-# Player Class (Hero)
-class Player(pygame.sprite.Sprite):
-    def __init__(self):
-        super().__init__()
-        self.image = pygame.Surface((50, 50))
-        self.image.fill(BLUE)
-        self.rect = self.image.get_rect()
-        self.rect.center = (100, SCREEN_HEIGHT - 100)
-        self.speed = PLAYER_SPEED
-        self.velocity = 0
-        self.health = 100
-        self.lives = 3
-        self.is_jumping = False
-        self.jump_count = 10
+
+import audio
+import savegame
+from game_core import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SCROLL_SPEED, World
+from parallax import Background
+from particles import ParticleSystem
+from profiler import FrameProfiler
+from scenes import Scene, SceneManager
+
+# The running game is autosaved here and can be continued from the title
+SAVE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'savegame.bin')
+
+
+# Draw the world and the HUD
+def draw_world(screen, font, world, background):
+    background.draw(screen, world.frames)
+    world.all_sprites.draw(screen)
+    pygame.draw.rect(screen, (255, 0, 0), pygame.Rect(10, 10, 200, 20))  # Health bar
+    pygame.draw.rect(screen, (0, 255, 0), pygame.Rect(10, 10, world.player.health * 2, 20))  # Player health
+    score_text = font.render(f"Score: {world.score}", True, (255, 255, 255))
+    screen.blit(score_text, (SCREEN_WIDTH - score_text.get_width() - 10, 10))
+    lives_text = font.render(f"Lives: {world.player.lives}  Level: {world.level}", True, (255, 255, 255))
+    screen.blit(lives_text, (10, 40))
+
+# Title Screen
+class TitleScene(Scene):
+    def __init__(self, manager, world, font):
+        super().__init__(manager)
+        self.world = world
+        self.text = font.render("ANIMAL HERO ADVENTURE - Press ENTER", True, (255, 255, 255))
+        self.continue_text = font.render("Press C to continue your saved game", True, (255, 255, 255))
+        self.can_continue = False
+
+    def enter(self):
+        self.can_continue = os.path.exists(SAVE_PATH)
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_RETURN:
+            self.manager.switch('play', new_game=True)
+        elif event.key == pygame.K_c and self.can_continue:
+            try:
+                savegame.load(self.world, SAVE_PATH)
+            except (OSError, ValueError):
+                # Unreadable or outdated save: start over instead
+                self.manager.switch('play', new_game=True)
+                return
+            self.manager.switch('boss' if self.world.boss_fight else 'play', resumed=True)
+
+    def draw(self, screen):
+        screen.fill((0, 0, 0))
+        screen.blit(self.text, (SCREEN_WIDTH // 2 - self.text.get_width() // 2, SCREEN_HEIGHT // 2))
+        if self.can_continue:
+            screen.blit(self.continue_text, (SCREEN_WIDTH // 2 - self.continue_text.get_width() // 2, SCREEN_HEIGHT // 2 + 40))
+
+# Main Play Scene
+class PlayScene(Scene):
+    boss_fight = False
+
+    def __init__(self, manager, world, sounds, particles, background, autosaver, font):
+        super().__init__(manager)
+        self.world = world
+        self.sounds = sounds
+        self.particles = particles
+        self.background = background
+        self.autosaver = autosaver
+        self.font = font
+
+    def enter(self, new_game=False, resumed=False):
+        if new_game:
+            self.world.reset()
+        if new_game or resumed:
+            self.particles.clear()
+            self.sounds.play_music()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_q:  # Shoot projectile
+                self.world.shoot()
 
     def update(self):
+        world = self.world
         keys = pygame.key.get_pressed()
+        world.step((keys[pygame.K_LEFT], keys[pygame.K_RIGHT], keys[pygame.K_SPACE]))
+        for name, x, y in world.events:
+            self.sounds.play(name)
+        self.particles.emit_events(world.events)
+        self.particles.update()
+
+        if world.game_over:
+            self.autosaver.discard()
+            self.manager.switch('game_over')
+            return
+        self.autosaver.update(world)
+        if world.boss_fight != self.boss_fight:
+            self.manager.switch('boss' if world.boss_fight else 'play')
+
+    def draw(self, screen):
+        draw_world(screen, self.font, self.world, self.background)
+        self.particles.draw(screen)
+
+# Boss Fight: the level timeline is paused until the boss is beaten or escapes
+class BossScene(PlayScene):
+    boss_fight = True
+
+    def draw(self, screen):
+        super().draw(screen)
+        boss = self.world.boss
+        width = SCREEN_WIDTH // 2
+        health = max(0, boss.health) * width // self.world.boss_health
+        pygame.draw.rect(screen, (255, 0, 0), pygame.Rect(SCREEN_WIDTH // 4, SCREEN_HEIGHT - 30, width, 15))
+        pygame.draw.rect(screen, (255, 165, 0), pygame.Rect(SCREEN_WIDTH // 4, SCREEN_HEIGHT - 30, health, 15))
 
-        # Horizontal movement
-        if keys[pygame.K_LEFT]:
-            self.rect.x -= self.speed
-        if keys[pygame.K_RIGHT]:
-            self.rect.x += self.speed
-
-        # Jumping
-        if not self.is_jumping:
-            if keys[pygame.K_SPACE]:
-                self.velocity = -JUMP_STRENGTH
-                self.is_jumping = True
-        else:
-            self.velocity += GRAVITY
-            self.rect.y += self.velocity
-
-        # Prevent player from going out of screen
-        if self.rect.left < 0:
-            self.rect.left = 0
-        if self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
-        if self.rect.bottom > SCREEN_HEIGHT - 50:
-            self.rect.bottom = SCREEN_HEIGHT - 50
-            self.is_jumping = False
-            self.velocity = 0
-
-    def shoot(self):
-        projectile = Projectile(self.rect.centerx, self.rect.top)
-        return projectile
-
-# Projectile Class
-class Projectile(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((10, 5))
-        self.image.fill(RED)
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        self.speed = PROJECTILE_SPEED
-
-    def update(self):
-        self.rect.x += self.speed
-        if self.rect.right > SCREEN_WIDTH:
-            self.kill()
-
-# Enemy Class
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y):
-        super().__init__()
-        self.image = pygame.Surface((50, 50))
-        self.image.fill(RED)
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        self.health = 50
-        self.speed = ENEMY_SPEED
+# Game Over Screen
+class GameOverScene(Scene):
+    def __init__(self, manager, sounds, font):
+        super().__init__(manager)
+        self.sounds = sounds
+        self.text = font.render("GAME OVER! Press R to Restart", True, (255, 255, 255))
 
-    def update(self):
-        self.rect.x -= self.speed
-        if self.rect.right < 0:
-            self.kill()
-
-    def take_damage(self, damage):
-        self.health -= damage
-        if self.health <= 0:
-            self.kill()
-
-# Collectible Class
-class Collectible(pygame.sprite.Sprite):
-    def __init__(self, x, y, type):
-        super().__init__()
-        self.type = type
-        self.image = pygame.Surface((COLLECTIBLE_SIZE, COLLECTIBLE_SIZE))
-        if self.type == 'health':
-            self.image.fill(GREEN)
-        else:
-            self.image.fill(WHITE)
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
+    def enter(self):
+        self.sounds.stop_music(500)
+        self.sounds.play('game_over')
 
-    def update(self):
-        self.rect.x -= 2
-        if self.rect.right < 0:
-            self.kill()
-
-# Level class with Boss Enemy
-class Boss(Enemy):
-    def __init__(self, x, y):
-        super().__init__(x, y)
-        self.image = pygame.Surface((100, 100))
-        self.image.fill((255, 165, 0))  # Orange boss color
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        self.health = BOSS_HEALTH
-        self.speed = 1
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_r:
+                self.manager.switch('play', new_game=True)
 
-# Game Over Screen
-def game_over():
-    game_over_text = font.render("GAME OVER! Press R to Restart", True, (255, 255, 255))
-    screen.blit(game_over_text, (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2))
-    pygame.display.update()
-
-    waiting = True
-    while waiting:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_r:
-                    main()
+    def draw(self, screen):
+        screen.blit(self.text, (SCREEN_WIDTH // 2 - self.text.get_width() // 2, SCREEN_HEIGHT // 2))
 
 # Main Game Loop
 def main():
-    # Create sprite groups
-    player = Player()
-    all_sprites = pygame.sprite.Group()
-    projectiles = pygame.sprite.Group()
-    enemies = pygame.sprite.Group()
-    collectibles = pygame.sprite.Group()
-
-    all_sprites.add(player)
-
-    score = 0
-    level = 1
-    while True:
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_q:  # Shoot projectile
-                    projectile = player.shoot()
-                    all_sprites.add(projectile)
-                    projectiles.add(projectile)
-
-        # Update all sprites
-        all_sprites.update()
-        projectiles.update()
-        enemies.update()
-        collectibles.update()
-
-        # Collision detection
-        for projectile in projectiles:
-            for enemy in enemies:
-                if projectile.rect.colliderect(enemy.rect):
-                    enemy.take_damage(25)
-                    score += 10
-                    projectile.kill()
-
-        # Spawn enemies and collectibles
-        if random.randint(1, 100) < 2:
-            enemy = Enemy(SCREEN_WIDTH, random.randint(100, SCREEN_HEIGHT - 100))
-            all_sprites.add(enemy)
-            enemies.add(enemy)
-
-        if random.randint(1, 100) < 3:
-            collectible = Collectible(SCREEN_WIDTH, random.randint(100, SCREEN_HEIGHT - 100), 'health')
-            all_sprites.add(collectible)
-            collectibles.add(collectible)
-
-        # Drawing
-        screen.fill((0, 0, 0))
-        all_sprites.draw(screen)
-        pygame.draw.rect(screen, (255, 0, 0), pygame.Rect(10, 10, 200, 20))  # Health bar
-        pygame.draw.rect(screen, (0, 255, 0), pygame.Rect(10, 10, player.health * 2, 20))  # Player health
-        score_text = font.render(f"Score: {score}", True, (255, 255, 255))
-        screen.blit(score_text, (SCREEN_WIDTH - score_text.get_width() - 10, 10))
-
-        pygame.display.update()
-
-        clock.tick(FPS)
+    # Initialize Pygame (mixer settings have to be set before init)
+    audio.pre_init()
+    pygame.init()
+
+    # Initialize the screen
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Animal Hero Adventure")
+    clock = pygame.time.Clock()
+
+    # Font for score and health
+    font = pygame.font.SysFont("Arial", 30)
+
+    # Sound effects are decoded once here and shared by every game
+    sounds = audio.SoundManager()
+    # Per-phase frame timing; F3 toggles the overlay, F4 exports CSV and JSON
+    profiler = FrameProfiler()
+    world = World(profiler)
+    # Hit, explosion and pickup effects share one particle pool
+    particles = ParticleSystem()
+    # Parallax layers are pre-rendered once the display format is known
+    background = Background(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_HEIGHT - 50, SCROLL_SPEED)
+    # Snapshots are taken every 10 seconds and written on a background thread
+    autosaver = savegame.Autosaver(SAVE_PATH)
+
+    manager = SceneManager(screen, clock, FPS, profiler)
+    manager.add('title', TitleScene(manager, world, font))
+    manager.add('play', PlayScene(manager, world, sounds, particles, background, autosaver, font))
+    manager.add('boss', BossScene(manager, world, sounds, particles, background, autosaver, font))
+    manager.add('game_over', GameOverScene(manager, sounds, font))
+    manager.run('title')
+
+    # Closing the window mid-game keeps the game for next time
+    if isinstance(manager.current, PlayScene) and not world.game_over:
+        autosaver.save(world)
+    autosaver.close()
+    pygame.quit()
 
 # Start the game
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import functools
+import json
+import os
+
+LEVEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'levels')
+CHUNK_FRAMES = 600  # Timeline is compiled 10 seconds (at 60 FPS) at a time
+SPAWN_TYPES = ('enemy', 'health', 'boss')
+DEFAULT_LANE = 300
+
+# Level files are JSON Lines, one wave per line, ordered by start frame:
+#   {"start": 120, "type": "enemy", "count": 5, "interval": 30, "lanes": [150, 300, 450]}
+# start is the frame of the first spawn, count spawns are placed interval
+# frames apart and cycle through lanes (the y position of each spawn).
+# A "boss" wave triggers the boss fight when it is reached.
+
+
+def level_count():
+    count = 0
+    while os.path.exists(level_path(count + 1, wrap=False)):
+        count += 1
+    return count
+
+
+def wrap_level(number):
+    # Level numbers past the last file loop back around the available levels
+    return (number - 1) % level_count() + 1
+
+
+def level_path(number, wrap=True):
+    if wrap:
+        number = wrap_level(number)
+    return os.path.join(LEVEL_DIR, f"level{number}.jsonl")
+
+
+def parsed_level(number):
+    # Whole level parsed once and shared, for running many games in one process.
+    # Wrapped first, so level 3 reuses level 1's waves instead of a copy
+    return _parse_level(wrap_level(number))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_level(number):
+    return tuple(read_waves(level_path(number, wrap=False)))
+
+
+def read_waves(path):
+    # Yield waves one line at a time so a long level is never fully in memory
+    last_start = 0
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            where = f"{path}:{line_number}"
+            try:
+                wave = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{where}: invalid JSON ({e})")
+            if wave.get('type') not in SPAWN_TYPES:
+                raise ValueError(f"{where}: type must be one of {', '.join(SPAWN_TYPES)}")
+            start = int(wave.get('start', 0))
+            if start < last_start:
+                raise ValueError(f"{where}: waves must be ordered by start frame")
+            count = int(wave.get('count', 1))
+            interval = int(wave.get('interval', 0))
+            lanes = [int(y) for y in wave.get('lanes', [DEFAULT_LANE])]
+            if count < 1 or interval < 0 or not lanes:
+                raise ValueError(f"{where}: count must be >= 1, interval >= 0 and lanes not empty")
+            last_start = start
+            yield Wave(start, wave['type'], count, interval, lanes)
+
+
+# Wave: a run of identical spawns described by one line of a level file
+class Wave:
+    def __init__(self, start, type, count, interval, lanes):
+        self.start = start
+        self.type = type
+        self.count = count
+        self.interval = interval
+        self.lanes = lanes
+        self.end = start + (count - 1) * interval
+
+    def events(self, first_frame, last_frame):
+        # Spawns with first_frame <= frame < last_frame, as (frame, type, y)
+        if self.interval == 0:
+            if first_frame <= self.start < last_frame:
+                return [(self.start, self.type, self.lanes[i % len(self.lanes)]) for i in range(self.count)]
+            return []
+        first = max(0, -(-(first_frame - self.start) // self.interval))
+        last = min(self.count, -(-(last_frame - self.start) // self.interval))
+        return [(self.start + i * self.interval, self.type, self.lanes[i % len(self.lanes)])
+                for i in range(first, last)]
+
+
+# Spawn Timeline: the level compiled into sorted (frame, type, y) events.
+# Only one chunk is compiled at a time, so memory depends on the chunk size
+# and the number of overlapping waves, not on the length of the level.
+class SpawnTimeline:
+    def __init__(self, source, chunk_frames=CHUNK_FRAMES):
+        self.chunk_frames = chunk_frames
+        self._waves = iter(())
+        self.load(source)
+
+    def close(self):
+        # Close the level file of a level that was left half way through
+        close = getattr(self._waves, 'close', None)
+        if close is not None:
+            close()
+
+    def load(self, source):
+        # source is a level file path or an already parsed sequence of waves
+        self.close()
+        if isinstance(source, str):
+            self._waves = read_waves(source)
+        else:
+            self._waves = iter(source)
+        self._next_wave = next(self._waves, None)
+        self._active = []
+        self.events = []
+        self.cursor = 0
+        self.chunk_end = 0
+        self.last_frame = -1  # Last frame passed to advance()
+        self._compile_chunk()
+
+    def _compile_chunk(self):
+        chunk_start = self.chunk_end
+        self.chunk_end = chunk_start + self.chunk_frames
+
+        while self._next_wave is not None and self._next_wave.start < self.chunk_end:
+            self._active.append(self._next_wave)
+            self._next_wave = next(self._waves, None)
+
+        events = []
+        for wave in self._active:
+            events.extend(wave.events(chunk_start, self.chunk_end))
+        events.sort()
+        self._active = [wave for wave in self._active if wave.end >= self.chunk_end]
+        self.events = events
+        self.cursor = 0
+
+    @property
+    def finished(self):
+        return (self.cursor == len(self.events) and not self._active
+                and self._next_wave is None)
+
+    def advance(self, frame):
+        # Return the events due up to and including this frame
+        self.last_frame = frame
+        events = self.events
+        start = self.cursor
+        cursor = start
+        while cursor < len(events) and events[cursor][0] <= frame:
+            cursor += 1
+        self.cursor = cursor
+        if cursor < len(events) or frame + 1 < self.chunk_end or self.finished:
+            return events[start:cursor]
+
+        # Current chunk is used up: compile the next one
+        due = events[start:cursor]
+        self._compile_chunk()
+        return due + self.advance(frame)
@@ -0,0 +1,103 @@
+import math
+import os
+
+import pygame
+
+ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Scrolling parallax background. Each layer is a pre-rendered tile strip
+# that only covers its own band of the screen; per frame a layer costs
+# screen width / tile width + 1 blits, whatever its depth.
+SKY_TOP = (10, 10, 40)
+SKY_BOTTOM = (60, 40, 90)
+HILL_COLOR = (35, 30, 70)
+GROUND_COLOR = (25, 60, 25)
+GROUND_MARK_COLOR = (45, 95, 45)
+
+
+# One scrolling layer: a tile blitted side by side across the screen
+class Layer:
+    def __init__(self, tile, y, speed):
+        self.tile = tile
+        self.y = y
+        self.speed = speed  # Pixels per simulation frame
+
+    def draw(self, screen, frames):
+        # Offset comes from the simulation clock, so fractional speeds
+        # scroll smoothly without accumulating drift
+        width = self.tile.get_width()
+        x = -int(frames * self.speed % width)
+        screen_width = screen.get_width()
+        while x < screen_width:
+            screen.blit(self.tile, (x, self.y))
+            x += width
+
+
+def prepare(surface):
+    # Convert to the display format once so every blit is a straight copy
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def sky_tile(width, height):
+    tile = pygame.Surface((width, height))
+    for y in range(height):
+        t = y / (height - 1)
+        color = [round(a + (b - a) * t) for a, b in zip(SKY_TOP, SKY_BOTTOM)]
+        pygame.draw.line(tile, color, (0, y), (width - 1, y))
+    return tile
+
+
+def cloud_tile(width, height):
+    # cloud.png has a black background, used as colorkey
+    cloud = pygame.image.load(os.path.join(ASSET_DIR, 'cloud.png'))
+    cloud.set_colorkey((0, 0, 0))
+    tile = pygame.Surface((width, height), pygame.SRCALPHA)
+    for i, (x, y) in enumerate(((0, 10), (width // 3, 45), (2 * width // 3, 0))):
+        scale = 1.0 - 0.2 * i
+        image = pygame.transform.scale(cloud, (int(cloud.get_width() * scale), int(cloud.get_height() * scale)))
+        tile.blit(image, (x, y))
+    return tile
+
+
+def hill_tile(width, height):
+    # Sine periods divide the tile width, so the strip wraps seamlessly
+    tile = pygame.Surface((width, height), pygame.SRCALPHA)
+    points = [(0, height)]
+    for x in range(0, width + 1, 8):
+        t = 2 * math.pi * x / width
+        y = height * (0.45 + 0.25 * math.sin(t) + 0.15 * math.sin(3 * t + 1))
+        points.append((x, y))
+    points.append((width, height))
+    pygame.draw.polygon(tile, HILL_COLOR, points)
+    return tile
+
+
+def ground_tile(width, height):
+    tile = pygame.Surface((width, height))
+    tile.fill(GROUND_COLOR)
+    for x in range(0, width, 40):
+        pygame.draw.rect(tile, GROUND_MARK_COLOR, (x, 6, 20, 4))
+    return tile
+
+
+# ground_speed is how far the world scrolls per frame; farther layers
+# move at a fraction of it
+class Background:
+    def __init__(self, screen_width, screen_height, ground_y, ground_speed):
+        hill_height = 160
+        # Far to near; the sky does not scroll and replaces the screen fill
+        self.sky = prepare(sky_tile(screen_width, screen_height))
+        self.layers = [
+            Layer(prepare(cloud_tile(600, 120)), 20, ground_speed / 8),
+            Layer(prepare(hill_tile(800, hill_height)), ground_y - hill_height, ground_speed / 4),
+            Layer(prepare(ground_tile(200, screen_height - ground_y)), ground_y, ground_speed),
+        ]
+
+    def draw(self, screen, frames):
+        screen.blit(self.sky, (0, 0))
+        for layer in self.layers:
+            layer.draw(screen, frames)
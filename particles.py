@@ -0,0 +1,106 @@
+import math
+
+import numpy as np
+import pygame
+
+# Particle System: every particle lives in a row of a few NumPy arrays, so a
+# frame is a handful of array operations no matter how many are alive.
+CAPACITY = 8192  # Live particles at most
+EMIT_BUDGET = 1024  # New particles per frame at most
+GRAVITY = 0.12
+DRAG = 0.97
+SIZE = 2  # Particles are SIZE x SIZE pixels
+
+# World event name -> (particles, colour, speed, life in frames)
+EFFECTS = {
+    'explosion': (60, (255, 140, 0), 4.0, 40),
+    'boss_hit': (25, (255, 220, 80), 3.0, 25),
+    'pickup': (30, (80, 255, 120), 2.0, 35),
+}
+
+
+class ParticleSystem:
+    def __init__(self, capacity=CAPACITY, emit_budget=EMIT_BUDGET, seed=None):
+        self.capacity = capacity
+        self.emit_budget = emit_budget
+        self.rng = np.random.default_rng(seed)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.float32)
+        self.count = 0
+        self.emitted = 0  # Particles emitted since the last update
+
+    def clear(self):
+        self.count = 0
+        self.emitted = 0
+
+    def emit(self, x, y, count, color, speed, life):
+        # Spawns are dropped once the frame budget or the capacity runs out
+        count = min(count, self.emit_budget - self.emitted, self.capacity - self.count)
+        if count <= 0:
+            return 0
+        new = slice(self.count, self.count + count)
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        velocity = self.rng.uniform(0.3, 1.0, count) * speed
+        self.pos[new] = (x, y)
+        self.vel[new, 0] = np.cos(angle) * velocity
+        self.vel[new, 1] = np.sin(angle) * velocity
+        self.life[new] = self.rng.uniform(0.6, 1.0, count) * life
+        self.max_life[new] = self.life[new]
+        self.color[new] = color
+        self.count += count
+        self.emitted += count
+        return count
+
+    def emit_events(self, events):
+        # Hook for World.events: (name, x, y) tuples from the last step
+        for name, x, y in events:
+            effect = EFFECTS.get(name)
+            if effect is not None:
+                self.emit(x, y, *effect)
+
+    def update(self):
+        self.emitted = 0
+        n = self.count
+        if n == 0:
+            return
+        pos, vel, life = self.pos[:n], self.vel[:n], self.life[:n]
+        vel *= DRAG
+        vel[:, 1] += GRAVITY
+        pos += vel
+        life -= 1
+
+        # Compact the survivors to the front so live particles stay contiguous
+        alive = life > 0
+        kept = int(np.count_nonzero(alive))
+        if kept < n:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.color):
+                array[:kept] = array[:n][alive]
+            self.count = kept
+
+    def draw(self, surface):
+        n = self.count
+        if n == 0:
+            return
+        width, height = surface.get_size()
+        x = self.pos[:n, 0].astype(np.intp)
+        y = self.pos[:n, 1].astype(np.intp)
+        visible = (x >= 0) & (x <= width - SIZE) & (y >= 0) & (y <= height - SIZE)
+        x, y = x[visible], y[visible]
+        # Fade out over the particle's life
+        fade = (self.life[:n] / self.max_life[:n])[visible, None]
+        colors = (self.color[:n][visible] * fade).astype(np.uint8)
+
+        try:
+            pixels = pygame.surfarray.pixels3d(surface)
+        except ValueError:
+            # Surfaces that surfarray can't map (8/16 bit) fall back to fills
+            for px, py, color in zip(x.tolist(), y.tolist(), colors.tolist()):
+                surface.fill(color, (px, py, SIZE, SIZE))
+            return
+        for dx in range(SIZE):
+            for dy in range(SIZE):
+                pixels[x + dx, y + dy] = colors
+        del pixels  # Unlocks the surface
@@ -0,0 +1,154 @@
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+
+PHASES = ('events', 'update', 'collision', 'spawn', 'draw', 'overlay', 'display')
+HISTORY = 600  # Frames kept for percentiles, graphs and export
+OVERLAY_REFRESH = 30  # Frames between percentile text updates
+FRAME_BUDGET_MS = 1000 / 60
+TOGGLE_KEY = pygame.K_F3
+EXPORT_KEY = pygame.K_F4
+
+# Overlay layout
+PANEL_POS = (10, 70)
+GRAPH_HEIGHT = 60
+GRAPH_SCALE = 2  # Pixels per millisecond
+TEXT_COLOR = (255, 255, 0)
+PANEL_COLOR = (0, 0, 0, 170)
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+# Frame Profiler: times each phase of a frame. Call begin_frame() once per
+# frame and mark(phase) after each phase; the time since the previous mark is
+# added to that phase. While disabled every call returns straight away.
+class FrameProfiler:
+    def __init__(self, enabled=False, history=HISTORY):
+        self.enabled = enabled
+        self.history = {phase: deque(maxlen=history) for phase in PHASES}
+        self.frames = deque(maxlen=history)
+        self.current = dict.fromkeys(PHASES, 0.0)
+        self.last = 0.0
+        self.frame_count = 0
+        self.font = None
+        self.panel = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.begin_frame()
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        for phase in PHASES:
+            self.current[phase] = 0.0
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[phase] += (now - self.last) * 1000
+        self.last = now
+
+    def end_frame(self):
+        if not self.enabled:
+            return
+        total = 0.0
+        for phase in PHASES:
+            self.history[phase].append(self.current[phase])
+            total += self.current[phase]
+        self.frames.append(total)
+        self.frame_count += 1
+
+    def handle_event(self, event):
+        # Returns True when the event was a profiler key
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == TOGGLE_KEY:
+            self.toggle()
+            return True
+        if event.key == EXPORT_KEY and self.frames:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            self.export(f"profile-{stamp}.json")
+            self.export(f"profile-{stamp}.csv")
+            return True
+        return False
+
+    def summary(self):
+        stats = {}
+        for name, values in list(self.history.items()) + [('frame', self.frames)]:
+            ordered = sorted(values)
+            stats[name] = {
+                'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+                'p50': percentile(ordered, 50),
+                'p95': percentile(ordered, 95),
+                'p99': percentile(ordered, 99),
+                'max': ordered[-1] if ordered else 0.0,
+            }
+        return stats
+
+    def export(self, path):
+        # Per-frame timings in milliseconds; the format follows the extension
+        rows = list(zip(*(self.history[phase] for phase in PHASES), self.frames))
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(PHASES + ('frame',))
+                for row in rows:
+                    writer.writerow([f"{value:.4f}" for value in row])
+        else:
+            with open(path, 'w') as f:
+                json.dump({
+                    'phases': list(PHASES),
+                    'summary': self.summary(),
+                    'frames': [[round(value, 4) for value in row] for row in rows],
+                }, f, indent=1)
+
+    def draw(self, screen):
+        if not self.enabled:
+            return
+        if self.font is None:
+            self.font = pygame.font.SysFont("monospace", 14)
+        # Sorting the history is the expensive part, so text is only rebuilt
+        # every OVERLAY_REFRESH frames
+        if self.panel is None or self.frame_count % OVERLAY_REFRESH == 0:
+            self._build_panel()
+        x, y = PANEL_POS
+        screen.blit(self.panel, (x, y))
+
+        # Frame time graph, newest frame on the right
+        graph_top = y + self.panel.get_height() - GRAPH_HEIGHT
+        width = self.panel.get_width()
+        frames = list(self.frames)[-width:]
+        if len(frames) > 1:
+            base = graph_top + GRAPH_HEIGHT
+            points = [(x + width - len(frames) + i, base - min(GRAPH_HEIGHT, ms * GRAPH_SCALE))
+                      for i, ms in enumerate(frames)]
+            pygame.draw.lines(screen, TEXT_COLOR, False, points)
+        budget_y = graph_top + GRAPH_HEIGHT - min(GRAPH_HEIGHT, FRAME_BUDGET_MS * GRAPH_SCALE)
+        pygame.draw.line(screen, (255, 0, 0), (x, budget_y), (x + width, budget_y))
+
+    def _build_panel(self):
+        stats = self.summary()
+        lines = ["phase       p50    p95    p99  (ms)"]
+        for name in PHASES + ('frame',):
+            s = stats[name]
+            lines.append(f"{name:<9} {s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f}")
+        rendered = [self.font.render(line, True, TEXT_COLOR) for line in lines]
+        width = max(text.get_width() for text in rendered) + 10
+        height = sum(text.get_height() for text in rendered) + GRAPH_HEIGHT + 10
+        self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        self.panel.fill(PANEL_COLOR)
+        text_y = 5
+        for text in rendered:
+            self.panel.blit(text, (5, text_y))
+            text_y += text.get_height()
@@ -0,0 +1,250 @@
+import os
+import struct
+import threading
+import zlib
+from array import array
+
+# Binary save format. A snapshot is a small header followed by a zlib
+# compressed payload: fixed-size world and player records, then one packed
+# array per entity field (x positions of every enemy, then y positions...).
+# Taking a snapshot is cheap enough for the main thread; compressing and
+# writing it can happen on the Autosaver thread.
+MAGIC = b'AHSV'
+VERSION = 2
+HEADER = struct.Struct('<4sHII')  # magic, version, crc32 and size of the raw payload
+# score, frames, level, level clock, last timeline frame, boss fight, game over,
+# enemy speed, boss health, spawn rate
+WORLD = struct.Struct('<qqidi??dqd')
+# x, y, velocity, health, lives, jumping, jump count
+PLAYER = struct.Struct('<iidqq?i')
+# projectiles, enemies, collectibles, index of the boss among the enemies (-1: none)
+COUNTS = struct.Struct('<IIIi')
+# Spawn RNG: whether a Gaussian is cached and its value; the Mersenne Twister
+# state (RNG_WORDS unsigned ints) follows as an array
+RNG = struct.Struct('<?d')
+RNG_WORDS = 625
+COLLECTIBLE_TYPES = ('health',)
+COMPRESSION = 1  # Fastest zlib level; entity arrays compress well anyway
+AUTOSAVE_FRAMES = 600  # Ten seconds at 60 FPS
+
+
+def _number(value):
+    # Speeds are stored as doubles; give integral ones back as ints
+    return int(value) if value == int(value) else value
+
+
+def encode(world):
+    # Raw (uncompressed) snapshot of everything needed to resume the world
+    player = world.player
+    projectiles = world.projectiles.sprites()
+    enemies = world.enemies.sprites()
+    collectibles = world.collectibles.sprites()
+    boss_index = enemies.index(world.boss) if world.boss in enemies else -1
+    _, rng_words, gauss_next = world.rng.getstate()
+    try:
+        types = array('B', [COLLECTIBLE_TYPES.index(c.type) for c in collectibles])
+    except ValueError:
+        raise ValueError("unknown collectible type, add it to COLLECTIBLE_TYPES")
+
+    parts = [
+        WORLD.pack(world.score, world.frames, world.level, world.frame, world.timeline.last_frame,
+                   world.boss_fight, world.game_over, world.enemy_speed, world.boss_health,
+                   world.spawn_rate),
+        PLAYER.pack(player.rect.x, player.rect.y, player.velocity, player.health, player.lives,
+                    player.is_jumping, player.jump_count),
+        RNG.pack(gauss_next is not None, gauss_next or 0.0),
+        array('I', rng_words),
+        COUNTS.pack(len(projectiles), len(enemies), len(collectibles), boss_index),
+        array('i', [s.rect.x for s in projectiles]),
+        array('i', [s.rect.y for s in projectiles]),
+        array('i', [s.rect.x for s in enemies]),
+        array('i', [s.rect.y for s in enemies]),
+        array('q', [s.health for s in enemies]),
+        array('d', [s.speed for s in enemies]),
+        array('i', [s.rect.x for s in collectibles]),
+        array('i', [s.rect.y for s in collectibles]),
+        types,
+    ]
+    return b''.join(parts)
+
+
+def pack(payload):
+    header = HEADER.pack(MAGIC, VERSION, zlib.crc32(payload), len(payload))
+    return header + zlib.compress(payload, COMPRESSION)
+
+
+def unpack(data):
+    if len(data) < HEADER.size:
+        raise ValueError("not a save file: too short")
+    magic, version, crc, size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a save file")
+    if version != VERSION:
+        raise ValueError(f"unsupported save version {version}, expected {VERSION}")
+    try:
+        payload = zlib.decompress(data[HEADER.size:])
+    except zlib.error:
+        raise ValueError("save file is corrupt")
+    if len(payload) != size or zlib.crc32(payload) != crc:
+        raise ValueError("save file is corrupt")
+    return payload
+
+
+def snapshot(world):
+    return pack(encode(world))
+
+
+def restore(world, data):
+    payload = memoryview(unpack(data))
+    offset = 0
+
+    def read_struct(record):
+        nonlocal offset
+        try:
+            values = record.unpack_from(payload, offset)
+        except struct.error:
+            raise ValueError("save file is corrupt")
+        offset += record.size
+        return values
+
+    def read_array(typecode, count):
+        nonlocal offset
+        values = array(typecode)
+        end = offset + count * values.itemsize
+        if end > len(payload):
+            raise ValueError("save file is corrupt")
+        values.frombytes(payload[offset:end])
+        offset = end
+        return values
+
+    (score, frames, level, frame, timeline_frame, boss_fight, game_over,
+     enemy_speed, boss_health, spawn_rate) = read_struct(WORLD)
+    x, y, velocity, health, lives, is_jumping, jump_count = read_struct(PLAYER)
+    has_gauss, gauss_next = read_struct(RNG)
+    rng_words = read_array('I', RNG_WORDS)
+    num_projectiles, num_enemies, num_collectibles, boss_index = read_struct(COUNTS)
+    projectile_x = read_array('i', num_projectiles)
+    projectile_y = read_array('i', num_projectiles)
+    enemy_x = read_array('i', num_enemies)
+    enemy_y = read_array('i', num_enemies)
+    enemy_health = read_array('q', num_enemies)
+    enemy_speed_values = read_array('d', num_enemies)
+    collectible_x = read_array('i', num_collectibles)
+    collectible_y = read_array('i', num_collectibles)
+    collectible_types = read_array('B', num_collectibles)
+    if offset != len(payload) or any(t >= len(COLLECTIBLE_TYPES) for t in collectible_types):
+        raise ValueError("save file is corrupt")
+
+    # Start from a clean world, as on restart, so sprites come from the pools
+    world.reset()
+    world.enemy_speed = _number(enemy_speed)
+    world.boss_health = boss_health
+    world.spawn_rate = spawn_rate
+    world.score = score
+    world.frames = frames
+    world.level = level
+    world.timeline.load(world.level_source(level))
+    if timeline_frame >= 0:
+        # Skip the spawns the saved game had already made
+        world.timeline.advance(timeline_frame)
+    world.frame = frame
+    world.rng.setstate((3, tuple(rng_words), gauss_next if has_gauss else None))
+
+    player = world.player
+    player.rect.topleft = (x, y)
+    player.velocity = _number(velocity)
+    player.health = health
+    player.lives = lives
+    player.is_jumping = is_jumping
+    player.jump_count = jump_count
+
+    for i in range(num_projectiles):
+        world.spawn_projectile(0, 0).rect.topleft = (projectile_x[i], projectile_y[i])
+    for i in range(num_enemies):
+        if i == boss_index:
+            enemy = world.spawn_boss(0)
+        else:
+            enemy = world.spawn_enemy(0, 0)
+        enemy.rect.topleft = (enemy_x[i], enemy_y[i])
+        enemy.health = enemy_health[i]
+        enemy.speed = _number(enemy_speed_values[i])
+    for i in range(num_collectibles):
+        collectible = world.spawn_collectible(0, 0, COLLECTIBLE_TYPES[collectible_types[i]])
+        collectible.rect.topleft = (collectible_x[i], collectible_y[i])
+
+    world.boss_fight = boss_fight
+    world.game_over = game_over
+
+
+def write_file(path, data):
+    # Write next to the target and swap it in, so a crash never leaves half a save
+    temp = path + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(data)
+    os.replace(temp, path)
+
+
+def save(world, path):
+    write_file(path, snapshot(world))
+
+
+def load(world, path):
+    with open(path, 'rb') as f:
+        restore(world, f.read())
+
+
+# Autosaver: the main thread only takes the raw snapshot; compression and
+# disk writes run on a background thread. If a write is still running when
+# the next snapshot arrives, only the newest pending snapshot is kept.
+class Autosaver:
+    def __init__(self, path, interval=AUTOSAVE_FRAMES):
+        self.path = path
+        self.interval = interval
+        self.last_save = 0
+        self._pending = None
+        self._discard = False
+        self._running = True
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='autosave', daemon=True)
+        self._thread.start()
+
+    def update(self, world):
+        # Call once per frame; saves every interval frames of play
+        if world.frames - self.last_save >= self.interval or world.frames < self.last_save:
+            self.save(world)
+
+    def save(self, world):
+        self.last_save = world.frames
+        payload = encode(world)
+        with self._condition:
+            self._pending = payload
+            self._discard = False
+            self._condition.notify()
+
+    def discard(self):
+        # Forget the save, e.g. after game over; pending snapshots are dropped
+        with self._condition:
+            self._pending = None
+            self._discard = True
+            self._condition.notify()
+
+    def close(self):
+        # Finish pending work and stop the thread
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and self._pending is None and not self._discard:
+                    self._condition.wait()
+                payload, discard = self._pending, self._discard
+                self._pending, self._discard = None, False
+                if payload is None and not discard and not self._running:
+                    return
+            if payload is not None:
+                write_file(self.path, pack(payload))
+            elif discard and os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,84 @@
+import pygame
+
+from profiler import FrameProfiler
+
+
+# Base Scene: one state of the game (title, play, boss, game over...)
+class Scene:
+    def __init__(self, manager):
+        self.manager = manager
+
+    def enter(self, **kwargs):
+        pass
+
+    def exit(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self, screen):
+        pass
+
+
+# Scene Manager: runs a single flat loop and swaps scenes between frames,
+# so moving from game over back to play never nests another loop
+class SceneManager:
+    def __init__(self, screen, clock, fps, profiler=None):
+        self.screen = screen
+        self.clock = clock
+        self.fps = fps
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.scenes = {}
+        self.current = None
+        self.pending = None
+        self.running = False
+
+    def add(self, name, scene):
+        self.scenes[name] = scene
+
+    def switch(self, name, **kwargs):
+        # Applied at the end of the frame so a scene never runs half-exited
+        self.pending = (name, kwargs)
+
+    def quit(self):
+        self.running = False
+
+    def _apply_pending(self):
+        name, kwargs = self.pending
+        self.pending = None
+        if self.current is not None:
+            self.current.exit()
+        self.current = self.scenes[name]
+        self.current.enter(**kwargs)
+
+    def run(self, name, **kwargs):
+        self.switch(name, **kwargs)
+        self._apply_pending()
+        self.running = True
+        profiler = self.profiler
+        while self.running:
+            profiler.begin_frame()
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.quit()
+                elif not profiler.handle_event(event):
+                    self.current.handle_event(event)
+            profiler.mark('events')
+
+            self.current.update()
+            profiler.mark('update')
+            self.current.draw(self.screen)
+            profiler.mark('draw')
+            profiler.draw(self.screen)
+            profiler.mark('overlay')
+            pygame.display.update()
+            profiler.mark('display')
+            profiler.end_frame()
+            self.clock.tick(self.fps)
+
+            if self.pending is not None:
+                self._apply_pending()
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Headless: SDL dummy drivers must be picked before pygame is initialised
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# The game modules live in the repository root, next to this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,84 @@
+import itertools
+
+import pygame
+import pytest
+
+import audio
+
+# Effect name -> (file, max simultaneous voices, priority)
+EFFECTS = {
+    'low': ('hit.wav', audio.NUM_CHANNELS, 1),
+    'mid': ('hit.wav', audio.NUM_CHANNELS, 2),
+    'limited': ('hit.wav', 2, 1),
+    'urgent': ('hit.wav', 1, audio.RESERVED_PRIORITY),
+}
+SHARED = audio.NUM_CHANNELS - audio.RESERVED_CHANNELS
+
+
+@pytest.fixture
+def sounds(monkeypatch):
+    # Each play gets a later tick, so "oldest voice" is well defined
+    ticks = itertools.count(1)
+    monkeypatch.setattr(pygame.time, 'get_ticks', lambda: next(ticks))
+    manager = audio.SoundManager(EFFECTS, music=None)
+    if not manager.enabled:
+        pytest.skip("no audio device, not even the SDL dummy driver")
+    # Ten seconds of silence keeps every voice busy for the whole test
+    silence = pygame.mixer.Sound(buffer=bytes(audio.FREQUENCY * 4 * 10))
+    for name, (sound, max_voices, priority) in manager.effects.items():
+        manager.effects[name] = (silence, max_voices, priority)
+    yield manager
+    manager.stop_all()
+    pygame.mixer.quit()
+
+
+def owner_names(manager):
+    return [owner and owner[0] for owner in manager.owners]
+
+
+def fill(manager, name, count=SHARED):
+    return [manager.play(name) for _ in range(count)]
+
+
+def test_voice_limit_restarts_oldest_voice(sounds):
+    first, second = fill(sounds, 'limited', 2)
+    assert first is not second
+    assert sounds.play('limited') is first
+    assert sounds.play('limited') is second
+    assert owner_names(sounds).count('limited') == 2
+
+
+def test_low_priority_never_uses_reserved_channels(sounds):
+    channels = fill(sounds, 'low')
+    assert None not in channels
+    assert owner_names(sounds)[:audio.RESERVED_CHANNELS] == [None] * audio.RESERVED_CHANNELS
+
+    # Every shared channel is busy: the oldest voice is restarted
+    assert sounds.play('low') is channels[0]
+    assert owner_names(sounds)[:audio.RESERVED_CHANNELS] == [None] * audio.RESERVED_CHANNELS
+
+
+def test_higher_priority_steals_oldest_lower_priority_voice(sounds):
+    channels = fill(sounds, 'low')
+    assert sounds.play('mid') is channels[0]
+
+    # The next steal takes the oldest remaining low voice, not the mid one
+    assert sounds.play('low') is channels[1]
+    assert owner_names(sounds)[audio.RESERVED_CHANNELS] == 'mid'
+
+
+def test_lower_priority_cannot_steal(sounds):
+    fill(sounds, 'mid')
+    assert sounds.play('low') is None
+    assert owner_names(sounds).count('mid') == SHARED
+
+
+def test_reserved_channels_for_high_priority(sounds):
+    fill(sounds, 'low')
+    channel = sounds.play('urgent')
+    assert channel is sounds.channels[0]
+    assert owner_names(sounds).count('low') == SHARED
+
+
+def test_unknown_effect_is_ignored(sounds):
+    assert sounds.play('missing') is None
@@ -0,0 +1,69 @@
+import pygame
+
+import collision
+
+SIZE = 40
+CORNER = SIZE - 4  # Offset at which only the transparent corners overlap
+
+
+def round_image():
+    # Opaque circle with transparent corners, like most sprite artwork
+    image = pygame.Surface((SIZE, SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(image, (255, 0, 0, 255), (SIZE // 2, SIZE // 2), SIZE // 2)
+    return image
+
+
+def square_image():
+    image = pygame.Surface((SIZE, SIZE), pygame.SRCALPHA)
+    image.fill((0, 255, 0, 255))
+    return image
+
+
+def make_sprite(image, x, y):
+    sprite = pygame.sprite.Sprite()
+    sprite.image = image
+    sprite.rect = image.get_rect(topleft=(x, y))
+    return sprite
+
+
+def test_transparent_corners_do_not_collide():
+    image = round_image()
+    a = make_sprite(image, 0, 0)
+    b = make_sprite(image, CORNER, CORNER)
+    assert a.rect.colliderect(b.rect)
+    assert not collision.collide(a, b)
+    assert not collision.collide(b, a)
+
+
+def test_overlapping_centres_collide():
+    image = round_image()
+    a = make_sprite(image, 0, 0)
+    b = make_sprite(image, SIZE // 4, SIZE // 4)
+    assert collision.collide(a, b)
+    assert collision.collide(b, a)
+
+
+def test_separate_rects_do_not_collide():
+    image = square_image()
+    assert not collision.collide(make_sprite(image, 0, 0), make_sprite(image, SIZE, 0))
+
+
+def test_masks_are_shared_per_image():
+    image = round_image()
+    a = make_sprite(image, 0, 0)
+    b = make_sprite(image, 100, 100)
+    assert collision.sprite_mask(a) is collision.sprite_mask(b) is collision.get_mask(image)
+
+
+def test_new_image_rebuilds_mask():
+    a = make_sprite(round_image(), 0, 0)
+    b = make_sprite(square_image(), CORNER, CORNER)
+    assert not collision.collide(a, b)
+    round_mask = a.mask
+
+    # Swapping the image (an animation frame) must not reuse the old mask
+    a.image = square_image()
+    assert collision.collide(a, b)
+    assert a.mask is not round_mask
+    assert a.mask is collision.get_mask(a.image)
+    assert a.mask.count() == SIZE * SIZE
@@ -0,0 +1,83 @@
+import numpy as np
+
+import env
+from game_core import CONTACT_DAMAGE, HEALTH_PICKUP
+
+NOTHING = np.zeros(1, dtype=np.int32)
+
+
+def test_damage_is_negative_and_healing_positive_reward():
+    vec = env.VecEnv(1)
+    vec.reset()
+    world = vec.worlds[0]
+    player = world.player.rect
+
+    world.spawn_enemy(player.centerx, player.centery)
+    obs, rewards, dones = vec.step(NOTHING)
+    assert rewards[0] == -CONTACT_DAMAGE
+
+    world.spawn_collectible(player.centerx, player.centery, 'health')
+    obs, rewards, dones = vec.step(NOTHING)
+    assert rewards[0] == HEALTH_PICKUP
+
+
+def test_finished_world_restarts_with_new_seed():
+    vec = env.VecEnv(2, max_frames=5, seed=10)
+    vec.reset()
+    assert [world.seed for world in vec.worlds] == [10, 11]
+
+    for _ in range(5):
+        obs, rewards, dones = vec.step(np.zeros(2, dtype=np.int32))
+    assert dones.all()
+    assert [result[0] for result in vec.results] == [10, 11]
+    assert [result[3] for result in vec.results] == [5, 5]
+    assert [world.seed for world in vec.worlds] == [12, 13]
+    assert [world.frames for world in vec.worlds] == [0, 0]
+
+
+def test_game_over_restarts_world():
+    vec = env.VecEnv(1, seed=3)
+    vec.reset()
+    vec.worlds[0].player.lives = 0
+    obs, rewards, dones = vec.step(NOTHING)
+    assert dones[0]
+    assert vec.results == [(3, 0, 1, 1)]
+    assert vec.worlds[0].seed == 4
+    assert not vec.worlds[0].game_over
+
+
+def test_run_games_rows_and_seeds():
+    results = env.run_games(7, workers=1, batch_size=3, max_frames=30, seed=100)
+    assert results.shape == (7, 4)
+    assert sorted(results[:, 0]) == list(range(100, 107))
+
+    results = env.run_games(9, workers=2, batch_size=2, max_frames=30)
+    assert results.shape == (9, 4)
+    assert sorted(results[:, 0]) == list(range(9))
+
+
+def test_short_games_do_not_crowd_out_long_ones():
+    # World 0 loses every game on its first frame while world 1 survives
+    # to max_frames; the survivor's game must still be counted
+    vec = env.VecEnv(2, max_frames=100, num_games=4)
+    vec.reset()
+    steps = 0
+    while not vec.finished and steps < 1000:
+        vec.worlds[0].player.lives = 0
+        vec.step(np.zeros(2, dtype=np.int32))
+        steps += 1
+    assert steps == 100
+    assert len(vec.results) == 4
+    assert sorted(result[0] for result in vec.results) == [0, 1, 2, 3]
+    assert [result[3] for result in vec.results].count(100) == 1
+    assert vec.games_started == 4
+
+
+def test_idle_worlds_are_not_stepped():
+    vec = env.VecEnv(3, max_frames=10, num_games=2)
+    vec.reset()
+    assert list(vec.active) == [True, True, False]
+    frames = vec.worlds[2].frames
+    obs, rewards, dones = vec.step(np.zeros(3, dtype=np.int32))
+    assert vec.worlds[2].frames == frames
+    assert rewards[2] == 0 and not dones[2]
@@ -0,0 +1,89 @@
+import pytest
+
+import levels
+from levels import CHUNK_FRAMES, SpawnTimeline, Wave
+
+# Waves placed around the chunk boundaries at 600, 1200 and 1800 frames
+BOUNDARY_WAVES = [
+    Wave(0, 'health', 4, CHUNK_FRAMES, [300]),  # Exactly on every boundary
+    Wave(CHUNK_FRAMES - 10, 'enemy', 6, 4, [150, 450]),  # Runs across the first boundary
+    Wave(CHUNK_FRAMES - 1, 'enemy', 3, 0, [100, 200, 300]),  # Burst on the last frame of a chunk
+    Wave(2 * CHUNK_FRAMES - 1, 'enemy', 2, 1, [250]),  # Last frame of one chunk, first of the next
+    Wave(2 * CHUNK_FRAMES + 5, 'enemy', 40, 30, [120, 480]),  # Spans two whole boundaries
+    Wave(4 * CHUNK_FRAMES, 'boss', 1, 0, [300]),  # After an empty chunk
+]
+LAST_FRAME = 4 * CHUNK_FRAMES + 100
+
+
+def expected_events(waves):
+    events = []
+    for wave in waves:
+        events.extend(wave.events(0, LAST_FRAME + 1))
+    return sorted(events)
+
+
+def test_every_frame_across_chunk_boundaries():
+    timeline = SpawnTimeline(BOUNDARY_WAVES)
+    seen = []
+    for frame in range(LAST_FRAME + 1):
+        due = timeline.advance(frame)
+        assert all(event[0] == frame for event in due), f"frame {frame}: {due}"
+        seen.extend(due)
+    assert seen == expected_events(BOUNDARY_WAVES)
+    assert timeline.finished
+
+
+@pytest.mark.parametrize('step', [7, 599, 600, 601, 1250])
+def test_skipping_frames_across_chunks(step):
+    # A spawn_rate above 1 advances the timeline several frames at a time
+    timeline = SpawnTimeline(BOUNDARY_WAVES)
+    seen = []
+    frame = 0
+    while frame <= LAST_FRAME:
+        due = timeline.advance(frame)
+        assert all(frame - step < event[0] <= frame for event in due)
+        seen.extend(due)
+        frame += step
+    seen.extend(timeline.advance(LAST_FRAME))
+    assert seen == expected_events(BOUNDARY_WAVES)
+    assert timeline.finished
+
+
+def test_small_chunks_match_one_big_chunk():
+    small = SpawnTimeline(BOUNDARY_WAVES, chunk_frames=13)
+    big = SpawnTimeline(BOUNDARY_WAVES, chunk_frames=10 * CHUNK_FRAMES)
+    for frame in range(LAST_FRAME + 1):
+        assert small.advance(frame) == big.advance(frame)
+
+
+def test_not_finished_while_waves_remain():
+    timeline = SpawnTimeline(BOUNDARY_WAVES)
+    timeline.advance(4 * CHUNK_FRAMES - 1)
+    assert not timeline.finished
+    assert timeline.advance(4 * CHUNK_FRAMES) == [(4 * CHUNK_FRAMES, 'boss', 300)]
+    assert timeline.finished
+
+
+def test_level_file_matches_parsed_level():
+    # Streaming the file and the cached parse give the same spawns
+    streamed = SpawnTimeline(levels.level_path(1))
+    parsed = SpawnTimeline(levels.parsed_level(1))
+    frame = 0
+    while not (streamed.finished and parsed.finished):
+        assert streamed.advance(frame) == parsed.advance(frame)
+        frame += 1
+    streamed.close()
+
+
+def test_read_waves_reports_line(tmp_path):
+    path = tmp_path / 'level.jsonl'
+    path.write_text('{"start": 100, "type": "enemy"}\n{"start": 50, "type": "enemy"}\n')
+    with pytest.raises(ValueError, match=r"level\.jsonl:2: waves must be ordered"):
+        list(levels.read_waves(str(path)))
+
+
+def test_parsed_level_shares_wrapped_levels():
+    count = levels.level_count()
+    for number in range(1, 3 * count + 1):
+        assert levels.parsed_level(number) is levels.parsed_level(levels.wrap_level(number))
+    assert levels._parse_level.cache_info().currsize <= count
@@ -0,0 +1,70 @@
+import numpy as np
+import pygame
+import pytest
+
+from particles import SIZE, ParticleSystem
+
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+
+
+def test_emit_budget_per_frame():
+    particles = ParticleSystem(capacity=100, emit_budget=30, seed=1)
+    assert particles.emit(10, 10, 50, RED, 1.0, 1000) == 30
+    assert particles.emit(10, 10, 5, RED, 1.0, 1000) == 0
+    assert particles.count == 30
+
+    # The budget is per frame: update() starts a new one
+    particles.update()
+    assert particles.emit(10, 10, 20, RED, 1.0, 1000) == 20
+    assert particles.emit(10, 10, 20, RED, 1.0, 1000) == 10
+    assert particles.count == 60
+
+
+def test_emit_stops_at_capacity():
+    particles = ParticleSystem(capacity=100, emit_budget=30, seed=1)
+    for _ in range(5):
+        particles.emit(10, 10, 30, RED, 1.0, 1000)
+        particles.update()
+    assert particles.count == 100
+    assert particles.emit(10, 10, 1, RED, 1.0, 1000) == 0
+    assert particles.count == 100
+
+
+def test_dead_particles_are_compacted():
+    particles = ParticleSystem(capacity=100, seed=1)
+    particles.emit(10, 10, 20, RED, 1.0, 5)
+    particles.emit(10, 10, 15, BLUE, 1.0, 100)
+    particles.emit(10, 10, 20, RED, 1.0, 5)
+
+    # A particle lives at most its max_life frames
+    for _ in range(5):
+        particles.update()
+    assert particles.count == 15
+    assert (particles.life[:15] > 0).all()
+    assert (particles.color[:15] == BLUE).all()
+
+    for _ in range(100):
+        particles.update()
+    assert particles.count == 0
+
+
+def test_draw_paints_particles():
+    surface = pygame.Surface((100, 100))
+    particles = ParticleSystem(seed=1)
+    particles.emit(50, 50, 1, RED, 0.0, 100)
+    particles.draw(surface)
+    assert surface.get_at((50, 50))[:3] == RED
+
+
+@pytest.mark.parametrize('depth', [8, 16, 24, 32])
+def test_draw_off_screen_and_low_depth(depth):
+    surface = pygame.Surface((100, 80), depth=depth)
+    particles = ParticleSystem(seed=1)
+    width, height = surface.get_size()
+    # Off every edge, on the last visible pixel and half over the edge
+    for x, y in [(-5, 40), (50, -5), (width + 5, 40), (50, height + 5), (-1, -1),
+                 (width - SIZE, height - SIZE), (width - 1, height - 1), (50, 40)]:
+        particles.emit(x, y, 1, RED, 0.0, 100)
+    particles.draw(surface)
+    assert np.array(surface.get_at((50, 40))[:3]).any()
@@ -0,0 +1,133 @@
+import struct
+import zlib
+
+import pytest
+
+import savegame
+from game_core import World
+
+FRAMES = 5000
+
+
+def controls(frame):
+    # Walk back and forth, jumping every second
+    return (frame % 240 >= 120, frame % 240 < 120, frame % 60 == 0)
+
+
+def play(world, until):
+    while world.frames < until and not world.game_over:
+        if world.frames % 10 == 0:
+            world.shoot()
+        world.step(controls(world.frames))
+
+
+def new_world(seed=7):
+    world = World(seed=seed)
+    world.player.lives = 1000  # Keep the scripted player alive for the whole run
+    return world
+
+
+@pytest.mark.parametrize('split', [0, 1, 100, 2500, 4999])
+def test_resumed_game_matches_original(split):
+    original = new_world()
+    play(original, split)
+    data = savegame.snapshot(original)
+
+    # A different seed proves the RNG state comes from the save
+    resumed = World(seed=99)
+    savegame.restore(resumed, data)
+    assert savegame.encode(resumed) == savegame.encode(original)
+
+    play(original, FRAMES)
+    play(resumed, FRAMES)
+    assert resumed.frames == original.frames == FRAMES
+    assert savegame.encode(resumed) == savegame.encode(original)
+
+
+def test_resume_during_boss_fight():
+    original = new_world()
+    while not original.boss_fight:
+        play(original, original.frames + 1)
+        assert original.frames < 20000, "level never reached its boss"
+    resumed = World()
+    savegame.restore(resumed, savegame.snapshot(original))
+    assert resumed.boss_fight
+    assert resumed.boss in resumed.enemies
+
+    play(original, original.frames + 600)
+    play(resumed, resumed.frames + 600)
+    assert savegame.encode(resumed) == savegame.encode(original)
+
+
+def test_save_and_load_file(tmp_path):
+    original = new_world()
+    play(original, 700)
+    path = str(tmp_path / 'save.bin')
+    savegame.save(original, path)
+
+    resumed = World()
+    savegame.load(resumed, path)
+    assert savegame.encode(resumed) == savegame.encode(original)
+
+
+def test_autosaver_writes_and_discards(tmp_path):
+    world = new_world()
+    path = str(tmp_path / 'save.bin')
+    autosaver = savegame.Autosaver(path, interval=100)
+    try:
+        play(world, 150)
+        autosaver.update(world)
+    finally:
+        autosaver.close()
+    resumed = World()
+    savegame.load(resumed, path)
+    assert resumed.frames == 150
+
+    autosaver = savegame.Autosaver(path)
+    autosaver.discard()
+    autosaver.close()
+    assert not (tmp_path / 'save.bin').exists()
+
+
+CORRUPT = ['empty', 'not a save', 'old version', 'bad zlib stream', 'truncated stream',
+           'flipped byte', 'short payload', 'trailing bytes', 'bad collectible type']
+
+
+@pytest.fixture(scope='module')
+def corrupt_saves():
+    world = new_world()
+    play(world, 300)
+    world.spawn_collectible(400, 300, 'health')
+    data = savegame.snapshot(world)
+    payload = savegame.encode(world)
+    header = savegame.HEADER.size
+    return {
+        'empty': b'',
+        'not a save': b'PNG' + bytes(40),
+        'old version': savegame.HEADER.pack(savegame.MAGIC, 1, 0, 0) + data[header:],
+        'bad zlib stream': data[:header] + bytes(32),
+        'truncated stream': data[:-8],
+        'flipped byte': data[:-20] + bytes([data[-20] ^ 0xff]) + data[-19:],
+        'short payload': savegame.pack(payload[:40]),
+        'trailing bytes': savegame.pack(payload + bytes(1)),
+        # The type of the last collectible is the last byte of the payload
+        'bad collectible type': savegame.pack(payload[:-1] + bytes([len(savegame.COLLECTIBLE_TYPES)])),
+    }
+
+
+@pytest.mark.parametrize('name', CORRUPT)
+def test_corrupt_save_raises_value_error(corrupt_saves, name):
+    with pytest.raises(ValueError):
+        savegame.restore(World(), corrupt_saves[name])
+
+
+def test_zlib_and_struct_errors_are_wrapped():
+    header = savegame.HEADER.pack(savegame.MAGIC, savegame.VERSION, 0, 0)
+    with pytest.raises(ValueError, match="corrupt") as info:
+        savegame.unpack(header + b'not zlib')
+    assert isinstance(info.value.__context__, zlib.error)
+
+    payload = b'\x00' * (savegame.WORLD.size - 1)
+    with pytest.raises(ValueError, match="corrupt") as info:
+        savegame.restore(World(), savegame.pack(payload))
+    assert isinstance(info.value.__context__, struct.error)